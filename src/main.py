@@ -4,17 +4,49 @@ It allows users to add, list, remove keybinds, and create, list, and run macros
 associated with these keybinds.
 """
 
+import contextlib
+import io
 import os
 import re
-import subprocess
-from typing import List, Optional
-from typing_extensions import Annotated
+import string
+import sys
+
+VERSION = (1, 0, 2)
+_VERSION_STR = ".".join(map(str, VERSION))
+
+# Fast path: `version --pure` is meant for shell prompts and scripts where
+# per-invocation latency compounds, so answer it before the typer/rich
+# import graph below is even loaded.
+if __name__ == "__main__" and len(sys.argv) >= 3 and sys.argv[1] == "version" \
+        and sys.argv[2] in ("--pure", "-p", "--raw", "-r"):
+    sys.stdout.write(_VERSION_STR + "\n")
+    sys.exit(0)
+
+from typing import Annotated, List, Optional
 import typer
-import questionary
-from rich import print, get_console
-from rich.table import Table
-from platformdirs import user_config_dir
-import orjson
+from rich import print
+from rich.console import Console
+
+# Matches positional argument placeholders like {0} in macro commands.
+_ARG_RE = re.compile(r"\{(\d+)\}")
+
+# Precomputed ANSI codes for per-command output in run_macro; empty when
+# stdout is not a terminal so piped output stays free of escape codes.
+_GREEN, _RESET = ("\x1b[32m", "\x1b[0m") if sys.stdout.isatty() else ("", "")
+
+# Characters that require a shell to interpret a command. Commands without
+# any of these can be exec'd directly, skipping the /bin/sh fork. '=' is
+# included because an env-assignment prefix (LC_ALL=C sort ...) is shell
+# syntax, not an executable name.
+_SHELL_META = set("|&;<>()$`\\\"'*?~[]{}#=\n")
+
+# Patterns and case-fold table for sanitize_name, built once. Separator
+# runs must collapse to a single hyphen (sanitized names are the identity
+# keys of stored keybinds/macros), so that stays a regex pass; the table
+# folds ASCII uppercase so no separate .lower() pass is needed.
+_SEP_RE = re.compile(r'[ _]+')
+_SANITIZE_TRANS = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+_SANITIZE_RE = re.compile(r'[^a-z0-9\-]+')
 
 def sanitize_name(name: str) -> str:
     """
@@ -27,12 +59,8 @@ def sanitize_name(name: str) -> str:
     Returns:
         str: The sanitized name.
     """
-    name = re.sub(r'[ _]+', '-', name)
-    name = re.sub(r'[^a-zA-Z0-9\-]', '', name)
-    return name.lower()
-
+    return _SANITIZE_RE.sub('', _SEP_RE.sub('-', name).translate(_SANITIZE_TRANS))
 
-VERSION = (1, 0, 2)
 
 DEV_DEBUG_MODE = os.getenv("MAK_DEBUG_MODE", "False").lower() == "true"
 APP_NAME = os.getenv("MAK_APP_NAME", "TRCLoop/Mak")
@@ -41,33 +69,90 @@ DATASTORE_NAME = os.getenv("MAK_DATASTORE_NAME", "data.json")
 
 
 GITHUB_LINK = "https://github.com/TRC-Loop/Mak"
-# pylint: disable=line-too-long
-ASCII_ART = """
-                                                                █████             
-                                                               ███████            
-      ██████████████████         ███████                       ███████            
-     ██████     █████████       ████████                       ███████            
-    ██████      █████████      ████████                       ███████             
-    ██████      █████████     █████████     ████████████████  █████████████████   
-    ██████     ███████████   ███ ██████   ██████    ███████   ████████  ███████   
-     ██████    ███████████  ███ ███████  ██████     ███████  ████████   ███████   
-              ████ ███████ ████ ███████ ███████    ████████  ███████    ███████   
-             █████  ██████████  ██████  ██████     ███████   ███████  ███████     
-             ████   █████████  ███████ ███████     ███████  ███████ ███████       
-            ████    ████████   ███████ ███████    ███████   ███████ ███████       
-          ██████     ██████    ███████  ██████   █████████ ████████  ███████      
-       ████████      █████     ███████  ███████  ███████ ███████   █████████    
-        █████        ████      ████████   ███████  ███████ ███████     ██████     
-                               ████████                                           
-                                ████████                                          
-                                  ████
-"""
-# pylint: enable=line-too-long
+# The banner artwork, zlib-compressed and base85-encoded: the raw art is
+# ~1.5KB of block characters that only info() ever needs, so it is decoded
+# on demand instead of sitting in the module constants of every command.
+_ASCII_ART_B85 = (
+    b'c-pmA!4ZHk2>UYy<2r!@I*C7P6&eDx*N1md2q7Mb7SDAa?>pI~H}*e+Ed1b&r{N(vJ{S!In}'
+    b'OrGKseoKYH$j6=TS~IlI!r}HNMy8DKZQeD-I}>;Y`DMSK^59WENnm&Ur(+geXz+$qzWGMw?i'
+    b'UY-KB1Kt?|#NwYSE`9O|$vqcwL1RUmuVhpq@q3{8k8X$b5NjkxZ5U{mS6L6dEL%S0>nyn+cJ'
+    b'%?~hp4=`XOKJ'
+)
+
+def _ascii_art() -> bytes:
+    """
+    Decodes the compressed banner artwork.
 
-_config_dir = user_config_dir(APP_NAME)
+    Returns:
+        bytes: The UTF-8 encoded banner.
+    """
+    import base64
+    import zlib
+    return zlib.decompress(base64.b85decode(_ASCII_ART_B85))
+
+# MAK_CONFIG_DIR pins the config directory directly — useful for distros and
+# latency-sensitive shell hooks. platformdirs and its platform probe are only
+# imported when the variable is unset.
+_config_dir = os.getenv("MAK_CONFIG_DIR")
+if not _config_dir:
+    from platformdirs import user_config_dir
+    _config_dir = user_config_dir(APP_NAME)
 _config_path = os.path.join(_config_dir, CONFIG_NAME)
 _datastore_path = os.path.join(_config_dir, DATASTORE_NAME)
 
+# Parsed JSON files memoized by path -> ((mtime_ns, size), dict), so repeated
+# loads within one invocation skip the disk read and the orjson parse.
+_load_cache: dict = {}
+
+# Files at least this large are parsed through mmap so orjson reads straight
+# from the page cache; for smaller files the copy is cheaper than the map.
+_MMAP_THRESHOLD = 64 * 1024
+
+def _load_json(path: str) -> dict:
+    """
+    Loads and parses a JSON file, memoized by its mtime and size.
+
+    Args:
+        path (str): The path of the JSON file to load.
+
+    Returns:
+        dict: The parsed content, or an empty dict if the file is missing.
+    """
+    import orjson
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return {}
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _load_cache.get(path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    if st.st_size >= _MMAP_THRESHOLD:
+        import mmap
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0,
+                                              access=mmap.ACCESS_READ) as mm:
+            view = memoryview(mm)
+            try:
+                obj = orjson.loads(view)
+            finally:
+                view.release()
+    else:
+        with open(path, 'rb') as f:
+            obj = orjson.loads(f.read())
+    _load_cache[path] = (stamp, obj)
+    return obj
+
+def _cache_saved(path: str, obj: dict):
+    """
+    Records a just-saved dict in the load cache, avoiding a re-parse.
+
+    Args:
+        path (str): The path the dict was saved to.
+        obj (dict): The dict that was saved.
+    """
+    st = os.stat(path)
+    _load_cache[path] = ((st.st_mtime_ns, st.st_size), obj)
+
 def load_config() -> dict:
     """
     Loads the configuration from the config file.
@@ -75,22 +160,59 @@ def load_config() -> dict:
     Returns:
         dict: The loaded configuration.
     """
-    if not os.path.exists(_config_path):
-        return {}
-    with open(_config_path, 'r', encoding='utf-8') as f:
-        return orjson.loads(f.read())
+    return _load_json(_config_path)
 
 def load_data() -> dict:
     """
     Loads the data from the datastore file.
 
+    Macros are stored as a dict keyed by name; entries written by older
+    versions as a list of {"name", "commands"} dicts are migrated in place
+    on load and rewritten in the new shape on the next save.
+
     Returns:
         dict: The loaded data.
     """
-    if not os.path.exists(_datastore_path):
-        return {}
-    with open(_datastore_path, 'r', encoding='utf-8') as f:
-        return orjson.loads(f.read())
+    data = _load_json(_datastore_path)
+    for entry in data.values():
+        macros = entry.get("macros") if isinstance(entry, dict) else None
+        if isinstance(macros, list):
+            entry["macros"] = {m["name"]: {"commands": m["commands"]} for m in macros}
+    return data
+
+# Set once the config directory is known to exist, so repeated saves in one
+# process skip the os.makedirs stat.
+_dir_ensured = False
+
+def _ensure_config_dir():
+    """
+    Creates the config directory if needed, at most once per process.
+    """
+    global _dir_ensured
+    if not _dir_ensured:
+        os.makedirs(_config_dir, exist_ok=True)
+        _dir_ensured = True
+
+def _atomic_write_bytes(path: str, payload: bytes):
+    """
+    Writes a payload to a file atomically.
+
+    The bytes go to a sibling temp file through an unbuffered os-level fd
+    (one write syscall, no Python file-object layer), are fsync'd, and the
+    temp file is os.replace()d over the target.
+
+    Args:
+        path (str): The destination path.
+        payload (bytes): The bytes to write.
+    """
+    tmp = path + ".tmp"
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        os.write(fd, payload)
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp, path)
 
 def save_config(cfg: dict):
     """
@@ -99,20 +221,57 @@ def save_config(cfg: dict):
     Args:
         cfg (dict): The configuration to save.
     """
-    os.makedirs(_config_dir, exist_ok=True)
-    with open(_config_path, 'wb') as f:
-        f.write(orjson.dumps(cfg, option=orjson.OPT_INDENT_2))
+    import orjson
+    _ensure_config_dir()
+    _atomic_write_bytes(_config_path, orjson.dumps(cfg, option=orjson.OPT_INDENT_2))
+    _cache_saved(_config_path, cfg)
 
 def save_data(data: dict):
     """
     Saves the given data to the datastore file.
 
+    The datastore is machine-managed, so it is written compactly; only the
+    (hand-editable) config file keeps indentation. In debug mode the
+    datastore is indented too, to ease inspecting it.
+
     Args:
         data (dict): The data to save.
     """
-    os.makedirs(_config_dir, exist_ok=True)
-    with open(_datastore_path, 'wb') as f:
-        f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    import orjson
+    _ensure_config_dir()
+    opts = orjson.OPT_INDENT_2 if DEV_DEBUG_MODE else 0
+    _atomic_write_bytes(_datastore_path, orjson.dumps(data, option=opts))
+    _cache_saved(_datastore_path, data)
+
+@contextlib.contextmanager
+def _datastore_txn():
+    """
+    Runs a read-modify-write of the datastore as one transaction.
+
+    An advisory lock on a sidecar .lock file (where fcntl exists; Windows
+    has no flock) keeps concurrent mak invocations from interleaving
+    between load and save. The loaded dict is yielded and persisted on a
+    clean exit; if the body raises, nothing is written.
+    """
+    _ensure_config_dir()
+    lock_fd = os.open(_datastore_path + ".lock", os.O_RDWR | os.O_CREAT, 0o600)
+    try:
+        try:
+            import fcntl
+            fcntl.flock(lock_fd, fcntl.LOCK_EX)
+        except ImportError:
+            pass
+        # A writer may have finished while we waited for the lock; the
+        # mtime+size stamp in _load_json makes this pick up its result.
+        data = load_data()
+        yield data
+        save_data(data)
+    finally:
+        os.close(lock_fd)
+
+# Shared console; highlighting is disabled since all styling here is
+# explicit markup and Rich's auto-highlighter costs a regex pass per print.
+console = Console(highlight=False)
 
 app = typer.Typer()
 
@@ -138,9 +297,8 @@ def version(
     """
     Displays the version information of Mak.
     """
-    base_ver = ".".join(map(str, VERSION))
     if pure:
-        print(base_ver)
+        print(_VERSION_STR)
         raise typer.Exit()
 
     if sparse:
@@ -149,7 +307,7 @@ def version(
         print("Patch:", VERSION[2])
         raise typer.Exit()
 
-    print("Version:", base_ver)
+    print("Version:", _VERSION_STR)
 
 @app.command(name="info", help="Display Info about Mak")
 def info():
@@ -157,14 +315,17 @@ def info():
     Displays general information about Mak, including version, GitHub link,
     and configuration paths.
     """
-    print(ASCII_ART)
-    print("Version", ".".join(map(str, VERSION)))
-    print("Github", GITHUB_LINK)
-    print("Config Path", _config_path)
-    print("Datastore Path", _datastore_path)
-    print("App Name", APP_NAME)
-    print("Debug Mode", DEV_DEBUG_MODE)
-    print("For help, use --help")
+    sys.stdout.buffer.write(_ascii_art() + b"\n")
+    sys.stdout.buffer.flush()
+    print(
+        f"Version {_VERSION_STR}\n"
+        f"Github {GITHUB_LINK}\n"
+        f"Config Path {_config_path}\n"
+        f"Datastore Path {_datastore_path}\n"
+        f"App Name {APP_NAME}\n"
+        f"Debug Mode {DEV_DEBUG_MODE}\n"
+        "For help, use --help"
+    )
 
 
 @keybinds_app.command(name="add", help="Add a new Keybind")
@@ -172,41 +333,53 @@ def keybinds_add(keybind: Annotated[str, typer.Argument(help="Keybind name")]):
     """
     Adds a new keybind to the datastore.
     """
-    data = load_data()
     _keybind = sanitize_name(keybind)
 
     if not _keybind == keybind:
         print(f"Sanitized: {keybind} → {_keybind}")
 
-    if _keybind in data:
-        print("Keybind already exists.")
-        raise typer.Abort()
+    with _datastore_txn() as data:
+        if _keybind in data:
+            print("Keybind already exists.")
+            raise typer.Abort()
 
-    data[_keybind] = {"macros": []}
-    save_data(data)
+        data[_keybind] = {"macros": {}}
     print(f"Added keybind: {_keybind}")
 
 
 @keybinds_app.command(name="list", help="List all Keybinds")
-def keybinds_list():
+def keybinds_list(
+    pretty: Annotated[bool, typer.Option("--pretty",
+                                         help="Render the listing as a table")] = False
+):
     """
     Lists all registered keybinds.
     """
     data = load_data()
-    keybinds = list(data.keys())
 
-    if not keybinds:
+    if not data:
         print("No keybinds found.")
         return
 
-    table = Table(title="Registered Keybinds")
-    table.add_column("#", justify="right", style="cyan")
-    table.add_column("Keybind", style="magenta")
+    if pretty:
+        from rich.table import Table
 
-    for i, kb in enumerate(keybinds, 1):
-        table.add_row(str(i), kb)
+        table = Table(title="Registered Keybinds")
+        table.add_column("#", justify="right", style="cyan")
+        table.add_column("Keybind", style="magenta")
 
-    print(table)
+        for i, kb in enumerate(data, 1):
+            table.add_row(str(i), kb)
+
+        print(table)
+        return
+
+    print("[bold]Registered Keybinds[/bold]")
+    buf = io.StringIO()
+    width = len(str(len(data)))
+    for i, kb in enumerate(data, 1):
+        buf.write(f"{str(i).rjust(width)}  {kb}\n")
+    sys.stdout.write(buf.getvalue())
 
 
 @keybinds_app.command(name="remove", help="Remove a Keybind")
@@ -214,13 +387,12 @@ def keybinds_remove(keybind: Annotated[str, typer.Argument(help="Keybind to remo
     """
     Removes a keybind from the datastore.
     """
-    data = load_data()
-    if keybind not in data:
-        print("Keybind not found.")
-        raise typer.Abort()
+    with _datastore_txn() as data:
+        if keybind not in data:
+            print("Keybind not found.")
+            raise typer.Abort()
 
-    del data[keybind]
-    save_data(data)
+        del data[keybind]
     print(f"Removed keybind: {keybind}")
 
 
@@ -234,32 +406,29 @@ def macros_add(
     """
     Adds a new macro to an existing keybind.
     """
-    data = load_data()
-
-    if keybind not in data:
-        print(f"Keybind '{keybind}' does not exist.")
-        raise typer.Abort()
+    macro_name = sanitize_name(name)
 
-    macro = {
-        "name": sanitize_name(name),
-        "commands": command.split(seperator)
-    }
+    with _datastore_txn() as data:
+        if keybind not in data:
+            print(f"Keybind '{keybind}' does not exist.")
+            raise typer.Abort()
 
-    existing_macros = data[keybind].setdefault("macros", [])
+        existing_macros = data[keybind].setdefault("macros", {})
 
-    if any(m["name"] == macro["name"] for m in existing_macros):
-        print(f"Macro '{macro['name']}' already exists under keybind '{keybind}'.")
-        raise typer.Abort()
+        if macro_name in existing_macros:
+            print(f"Macro '{macro_name}' already exists under keybind '{keybind}'.")
+            raise typer.Abort()
 
-    existing_macros.append(macro)
-    save_data(data)
-    print(f"[green]Macro '{macro['name']}' added to keybind '{keybind}'")
+        existing_macros[macro_name] = {"commands": command.split(seperator)}
+    print(f"[green]Macro '{macro_name}' added to keybind '{keybind}'")
     print(f"[gray]-> Command: {command}")
 
 
 @macros_app.command(name="list", help="List all macros for a keybind")
 def macros_list(
-    keybind: Annotated[str, typer.Argument(help="Keybind to list macros for")]
+    keybind: Annotated[str, typer.Argument(help="Keybind to list macros for")],
+    pretty: Annotated[bool, typer.Option("--pretty",
+                                         help="Render the listing as a table")] = False
 ):
     """
     Lists all macros associated with a specific keybind.
@@ -269,22 +438,35 @@ def macros_list(
         print(f"Keybind '{keybind}' not found.")
         raise typer.Abort()
 
-    macros = data[keybind].get("macros", [])
+    macros = data[keybind].get("macros", {})
 
     if not macros:
         print(f"No macros found for keybind '{keybind}'.")
         return
 
-    table = Table(title=f"Macros for '{keybind}'")
-    table.add_column("#", justify="right", style="cyan")
-    table.add_column("Name", style="magenta")
-    table.add_column("Commands", style="green")
+    if pretty:
+        from rich.table import Table
 
-    for i, macro in enumerate(macros, 1):
-        command_str = " ; ".join(macro["commands"])
-        table.add_row(str(i), macro["name"], command_str)
+        table = Table(title=f"Macros for '{keybind}'")
+        table.add_column("#", justify="right", style="cyan")
+        table.add_column("Name", style="magenta")
+        table.add_column("Commands", style="green")
+
+        for i, (macro_name, macro) in enumerate(macros.items(), 1):
+            command_str = " ; ".join(macro["commands"])
+            table.add_row(str(i), macro_name, command_str)
 
-    print(table)
+        print(table)
+        return
+
+    print(f"[bold]Macros for '{keybind}'[/bold]")
+    buf = io.StringIO()
+    width = len(str(len(macros)))
+    name_width = max(len(macro_name) for macro_name in macros)
+    for i, (macro_name, macro) in enumerate(macros.items(), 1):
+        command_str = " ; ".join(macro["commands"])
+        buf.write(f"{str(i).rjust(width)}  {macro_name.ljust(name_width)}  {command_str}\n")
+    sys.stdout.write(buf.getvalue())
 
 def select_from_list(title: str, options: list[str]) -> str:
     """
@@ -300,11 +482,26 @@ def select_from_list(title: str, options: list[str]) -> str:
     Raises:
         Exception: If no options are provided or no selection is made.
     """
-    console = get_console()
     if not options:
         console.print("[red]No options to choose from.[/red]")
         raise ValueError("No options")
 
+    # Without a tty (or with MAK_PLAIN=1) fall back to a numbered prompt so
+    # questionary and its prompt_toolkit tree are never imported.
+    if not sys.stdin.isatty() or os.getenv("MAK_PLAIN", "False").lower() == "true":
+        print(f"{title}:")
+        for i, option in enumerate(options, 1):
+            sys.stdout.write(f"{i}. {option}\n")
+        try:
+            choice = int(input("> "))
+        except (ValueError, EOFError) as exc:
+            raise ValueError("No selection made") from exc
+        if not 1 <= choice <= len(options):
+            raise ValueError("No selection made")
+        return options[choice - 1]
+
+    import questionary
+
     answer = questionary.select(
         message=f"{title}:",
         choices=options,
@@ -322,14 +519,20 @@ def run_macro(
     keybind: Optional[str] = typer.Argument(None, help="The keybind to run."),
     name: Optional[str] = typer.Argument(None, help="The name of the macro to run."),
     args: Optional[List[str]] = typer.Argument(None, help="Arguments for the macro commands."),
+    sequential: bool = typer.Option(False, "--sequential",
+                                    help="Run each command in its own shell process."),
 ):
     """
     Runs a macro associated with a keybind. If keybind or macro name are not provided,
     the user will be prompted to select them.
+
+    By default all commands are joined with '&&' and run in a single shell;
+    --sequential spawns one shell per command instead.
     """
+    import subprocess
+
     args = args or []
 
-    console = get_console()
     data = load_data()
 
     if not data:
@@ -338,7 +541,7 @@ def run_macro(
 
     if not keybind:
         try:
-            keybind = select_from_list("Available Keybinds", list(data.keys()))
+            keybind = select_from_list("Available Keybinds", list(data))
         except ValueError as e:
             console.print(f"[red]{e}[/red]")
             raise typer.Abort() from e
@@ -348,13 +551,13 @@ def run_macro(
         console.print(f"[red]Keybind '{keybind}' not found.[/red]")
         raise typer.Abort()
 
-    macros = data[keybind].get("macros", [])
+    macros = data[keybind].get("macros", {})
     if not macros:
         console.print(f"[red]No macros available under keybind '{keybind}'.[/red]")
         raise typer.Abort()
 
     if not name:
-        macro_names = [m["name"] for m in macros]
+        macro_names = list(macros)
         try:
             name = select_from_list(f"Available Macros for '{keybind}'", macro_names)
         except ValueError as e:
@@ -363,37 +566,79 @@ def run_macro(
 
 
     name = sanitize_name(name)
-    macro = next((m for m in macros if m["name"] == name), None)
+    macro = macros.get(name)
     if not macro:
         console.print(f"[red]Macro '{name}' not found under keybind '{keybind}'.[/red]")
         raise typer.Abort()
 
-    arg_indices = sorted(
-        set(int(i) for cmd in macro["commands"] for i in re.findall(r"{(\d+)}", cmd))
-    )
-
-    while len(args) < len(arg_indices):
-        idx = arg_indices[len(args)]
-        val = typer.prompt(f"Enter value for argument {{{idx}}}")
-        args.append(val)
+    needed = 0
+    for cmd in macro["commands"]:
+        for match in _ARG_RE.finditer(cmd):
+            idx = int(match.group(1)) + 1
+            if idx > needed:
+                needed = idx
+
+    if len(args) < needed:
+        missing = range(len(args), needed)
+        if sys.stdin.isatty() and os.getenv("MAK_PLAIN", "False").lower() != "true":
+            # One questionary form collects every missing value in a single
+            # prompt_toolkit session instead of a terminal round-trip each.
+            import questionary
+            answers = questionary.form(**{
+                f"arg{i}": questionary.text(f"Enter value for argument {{{i}}}")
+                for i in missing
+            }).ask()
+            if answers is None:
+                raise typer.Abort()
+            args.extend(answers[f"arg{i}"] for i in missing)
+        else:
+            for i in missing:
+                args.append(typer.prompt(f"Enter value for argument {{{i}}}"))
+
+    # The prompt loop above guarantees args covers every {N} the scan saw,
+    # so substitution cannot run out of values. Replacing via _ARG_RE also
+    # leaves non-placeholder braces (awk '{print}', find {} ...) untouched,
+    # which str.format would have choked on.
+    resolved_cmds = [
+        _ARG_RE.sub(lambda m: args[int(m.group(1))], raw_cmd)
+        for raw_cmd in macro["commands"]
+    ]
 
     console.print()
     console.print(f"[bold green]Executing macro:[/bold green] [cyan]{name}[/cyan]\n"
                   f"[dim]Keybind: {keybind}[/dim]")
 
-    for raw_cmd in macro["commands"]:
-        try:
-            resolved_cmd = raw_cmd.format(*args)
-        except IndexError as exc:
-            console.print(f"[red]Missing arguments for command: '{raw_cmd}'[/red]")
-            raise typer.Abort() from exc
+    if sequential:
+        for resolved_cmd in resolved_cmds:
+            sys.stdout.write(f"{_GREEN}→ {resolved_cmd}{_RESET}\n")
+            sys.stdout.flush()
+            result = subprocess.run(resolved_cmd, shell=True, check=False)
 
-        console.print(f"[green]→ {resolved_cmd}[/green]")
-        result = subprocess.run(resolved_cmd, shell=True, check=False)
+            if result.returncode != 0:
+                console.print(f"[red]Command failed with code {result.returncode}[/red]")
+                raise typer.Abort()
+        return
 
-        if result.returncode != 0:
-            console.print(f"[red]Command failed with code {result.returncode}[/red]")
-            raise typer.Abort()
+    sys.stdout.write("".join(f"{_GREEN}→ {cmd}{_RESET}\n" for cmd in resolved_cmds))
+    sys.stdout.flush()
+
+    if len(resolved_cmds) == 1 and not _SHELL_META.intersection(resolved_cmds[0]):
+        argv = resolved_cmds[0].split()
+        if argv:
+            try:
+                # Replace this process with the command: no shell, no fork,
+                # and the command's exit status becomes mak's.
+                os.execvp(argv[0], argv)
+            except OSError:
+                # Shell builtin, not on PATH, or not executable: fall
+                # through and let the shell run and report it as before.
+                pass
+
+    result = subprocess.run(" && ".join(resolved_cmds), shell=True, check=False)
+
+    if result.returncode != 0:
+        console.print(f"[red]Command failed with code {result.returncode}[/red]")
+        raise typer.Abort()
 
 
 app.add_typer(keybinds_app, name="keys", help="Manage all available keybinds in Mak.")